@@ -1,14 +1,17 @@
 """The Alpicool BLE integration."""
 
+import asyncio
+from functools import partial
 import logging
 
 from bleak.exc import BleakError
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HassJob, HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.loader import async_get_loaded_integration
 
 from .api import FridgeApi
 from .const import DOMAIN
@@ -32,8 +35,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     api = FridgeApi(address)
     hass.data[DOMAIN][entry.entry_id] = api
 
+    # Import the platform modules while the BLE connection is being set up,
+    # they are forwarded as soon as the initial status is known.
+    integration = async_get_loaded_integration(hass, DOMAIN)
+    connect_task = hass.async_create_task(api.connect())
+
     try:
-        if not await api.connect():
+        await integration.async_get_platforms(PLATFORMS)
+        if not await connect_task:
             raise ConfigEntryNotReady(
                 f"Could not connect to Alpicool device at {address}"
             )
@@ -42,29 +51,43 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 f"Could not get initial status from Alpicool device at {address}"
             )
     except BleakError as e:
-        await api.disconnect()
+        await _async_abort_setup(api, connect_task)
         raise ConfigEntryNotReady(
             f"Failed to initialize Alpicool device at {address}: {e}"
         ) from e
+    except BaseException:
+        await _async_abort_setup(api, connect_task)
+        raise
 
     api.set_initial_timestamp()
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Built once so every poll reuses the same job instead of a new closure
+    update_job = HassJob(
+        partial(async_dispatcher_send, hass, f"{DOMAIN}_{address}_update")
+    )
     entry.async_create_background_task(
         hass,
-        api.start_polling(
-            lambda: async_dispatcher_send(hass, f"{DOMAIN}_{address}_update")
-        ),
+        api.start_polling(partial(hass.async_run_hass_job, update_job)),
         name="alpicool_ble_poll",
     )
 
     return True
 
 
+async def _async_abort_setup(api: FridgeApi, connect_task: asyncio.Task) -> None:
+    """Stop a connect still in progress and close the connection after a failed setup."""
+    connect_task.cancel()
+    # Wait for the connect to actually stop, so it can't reopen the connection
+    await asyncio.gather(connect_task, return_exceptions=True)
+    await api.disconnect()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    api: FridgeApi = hass.data[DOMAIN].pop(entry.entry_id)
-    await api.disconnect()
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        api: FridgeApi = hass.data[DOMAIN].pop(entry.entry_id)
+        await api.disconnect()
 
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    return unload_ok
@@ -1,19 +1,172 @@
 """API for Alpicool fridges based on modern BLE protocol."""
 
 import asyncio
+import functools
 import logging
+from operator import itemgetter
+import struct
+import time
 
 from bleak import BleakClient
+from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak.exc import BleakError
 
 from .const import FRIDGE_NOTIFY_UUID, FRIDGE_RW_CHARACTERISTIC_UUID, Request
 
 _LOGGER = logging.getLogger(__name__)
 
-
-def _to_signed_byte(b: int) -> int:
-    """Convert an unsigned byte (0-255) to a signed byte (-128-127)."""
-    return b - 256 if b > 127 else b
+# Fixed packets that don't follow the generic length/checksum rules
+_BIND_PACKET = b"\xfe\xfe\x03\x00\x01\xff"
+_QUERY_PACKET = b"\xfe\xfe\x03\x01\x02\x00"
+_STATIC_PACKETS = {Request.BIND: _BIND_PACKET, Request.QUERY: _QUERY_PACKET}
+
+# Every packet starts with a two byte magic followed by the length byte
+_PACKET_MAGIC = b"\xfe\xfe"
+_HEADER = struct.Struct(">2sB")
+# Header of an outgoing command: magic, length byte and command code
+_COMMAND_HEADER = struct.Struct(">2sBB")
+# Polling interval, and the retry interval that doubles on each consecutive
+# failure up to a cap so a flaky link isn't hammered with reconnects
+_POLL_INTERVAL = 30
+_RETRY_INTERVAL = 60
+_MAX_RETRY_INTERVAL = 600
+
+# Time to wait for the bind response. This is long on purpose: a fridge
+# showing "APP" only answers once its pairing button has been pressed.
+_BIND_TIMEOUT = 20
+
+# Status younger than this is returned as is instead of querying again
+_STATUS_MAX_AGE = 2.0
+# The poll loop skips its query when a status arrived this recently anyway,
+# e.g. in response to a command or an entity refresh
+_POLL_STATUS_MAX_AGE = _POLL_INTERVAL / 2
+
+# Delay used to coalesce rapid writes (e.g. slider drags) into a single send
+_WRITE_DEBOUNCE_DELAY = 0.15
+
+# setOther payload layouts, signed codes take care of negative temperatures.
+# The unused right zone bytes are sent as zero padding.
+_SET_OTHER = struct.Struct("<BBBBbbbbBBbbbb")
+_SET_OTHER_DUAL = struct.Struct(_SET_OTHER.format + "bxxbbbbbxxx")
+
+# Field values in setOther order, falling back to these defaults for fields
+# the fridge didn't report
+_SET_OTHER_DEFAULTS = {
+    "locked": 0,
+    "powered_on": 1,
+    "run_mode": 0,
+    "bat_saver": 0,
+    "left_target": 0,
+    "temp_max": 20,
+    "temp_min": -20,
+    "left_ret_diff": 1,
+    "start_delay": 0,
+    "unit": 0,
+    "left_tc_hot": 0,
+    "left_tc_mid": 0,
+    "left_tc_cold": 0,
+    "left_tc_halt": 0,
+}
+_SET_OTHER_DUAL_DEFAULTS = {
+    **_SET_OTHER_DEFAULTS,
+    "right_target": 0,
+    "right_ret_diff": 1,
+    "right_tc_hot": 0,
+    "right_tc_mid": 0,
+    "right_tc_cold": 0,
+    "right_tc_halt": 0,
+}
+_set_other_values = itemgetter(*_SET_OTHER_DEFAULTS)
+_set_other_dual_values = itemgetter(*_SET_OTHER_DUAL_DEFAULTS)
+
+
+def _resolve_future(future: asyncio.Future[bool] | None, result: bool) -> None:
+    """Resolve a pending response future, unless it is already done."""
+    if future is not None and not future.done():
+        future.set_result(result)
+
+
+def _poll_delay(failures: int) -> float:
+    """Return the delay before the next poll after consecutive failures."""
+    if not failures:
+        return _POLL_INTERVAL
+    return min(_RETRY_INTERVAL * 2 ** (failures - 1), _MAX_RETRY_INTERVAL)
+
+
+def _build_packet(cmd: int, data: bytes = b"") -> bytes:
+    """Build a BLE command packet based on known working examples and protocol quirks."""
+    if (packet := _STATIC_PACKETS.get(cmd)) is not None:
+        return packet
+
+    _LOGGER.debug("Using dynamic builder for cmd %s", cmd)
+
+    # Length byte counts the command, the data and the checksum
+    packet = bytearray(_COMMAND_HEADER.size + len(data) + 2)
+    _COMMAND_HEADER.pack_into(packet, 0, _PACKET_MAGIC, len(data) + 3, cmd)
+    packet[_COMMAND_HEADER.size : -2] = data
+    # 2-byte big endian checksum. The checksum slot is still zero, so it
+    # doesn't contribute to the sum.
+    packet[-2:] = (sum(packet) & 0xFFFF).to_bytes(2, "big")
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Dynamically built packet for cmd %s: %s", cmd, packet.hex())
+    return packet
+
+
+@functools.lru_cache(maxsize=512)
+def _temperature_packet(cmd: int, temp: int) -> bytes:
+    """Return the (cached) packet setting a zone's target temperature."""
+    return bytes(_build_packet(cmd, bytes([temp & 0xFF])))
+
+
+# Status payload layouts. Temperatures are signed bytes ("b"), so no manual
+# sign conversion is needed after unpacking.
+_STATUS_BASE = struct.Struct("<??BBbbbbBBbbbbbBBB")
+_STATUS_BASE_KEYS = (
+    "locked",
+    "powered_on",
+    "run_mode",
+    "bat_saver",
+    "left_target",
+    "temp_max",
+    "temp_min",
+    "left_ret_diff",
+    "start_delay",
+    "unit",
+    "left_tc_hot",
+    "left_tc_mid",
+    "left_tc_cold",
+    "left_tc_halt",
+    "left_current",
+    "bat_percent",
+    "bat_vol_int",
+    "bat_vol_dec",
+)
+
+# Dual zone models append the right zone settings
+_STATUS_DUAL = struct.Struct(_STATUS_BASE.format + "bBBbbbbbbB")
+_STATUS_DUAL_KEYS = (
+    *_STATUS_BASE_KEYS,
+    "right_target",
+    "unknown_19",
+    "unknown_20",
+    "right_ret_diff",
+    "right_tc_hot",
+    "right_tc_mid",
+    "right_tc_cold",
+    "right_tc_halt",
+    "right_current",
+    "running_status",
+)
+
+# Some firmwares send extra unknown fields at the end
+_STATUS_EXTENDED = struct.Struct(_STATUS_DUAL.format + "BBB")
+_STATUS_EXTENDED_KEYS = (
+    *_STATUS_DUAL_KEYS,
+    "unknown_28",
+    "unknown_29",
+    "unknown_30",
+)
 
 
 class FridgeApi:
@@ -23,71 +176,62 @@ class FridgeApi:
         """Initialize the API."""
         self._lock = asyncio.Lock()
         self.status = {}
-        self._status_updated_event = asyncio.Event()
-        self._bind_event = asyncio.Event()
+        # Resolved with True on response or False on timeout
+        self._status_future: asyncio.Future[bool] | None = None
+        self._bind_future: asyncio.Future[bool] | None = None
         self._poll_task = None
         self._address = address
-        self._client = BleakClient(self._address, timeout=30.0)
+        self._client = BleakClient(
+            self._address, disconnected_callback=self._on_disconnected, timeout=30.0
+        )
         self._write_requires_response = False
+        # Whether commands can be sent as acknowledged write requests
+        self._write_supports_response = False
+        # Notifications stay subscribed for the lifetime of a connection
+        self._notify_started = False
+        # Characteristics resolved on connect, only valid for that connection
+        self._write_char: BleakGATTCharacteristic | None = None
+        self._notify_char: BleakGATTCharacteristic | None = None
         # Buffer for reassembling fragmented packets
         self._notification_buffer = bytearray()
+        # Raw payload of the last status response, used to detect changes
+        self._last_status_payload: bytes | None = None
+        self._status_changed = False
+        # Monotonic time of the last status response, None once it is stale
+        self._status_time: float | None = None
+        # Handlers for incoming packets, keyed by command code
+        self._packet_handlers = {
+            Request.QUERY: self._on_status,
+            Request.BIND: self._on_bind,
+            Request.SET: self._on_set_echo,
+            Request.SET_LEFT: self._on_set_echo,
+            Request.SET_RIGHT: self._on_set_echo,
+        }
         self.is_available: bool = True
         self._last_successful_update_time: float = 0.0
+        # Pending writes, coalesced until the debounce timer fires
+        self._pending_values: dict = {}
+        # Zone temperature command -> (status key, target temperature)
+        self._pending_temperatures: dict[int, tuple[str, int]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_future: asyncio.Future | None = None
+        self._flush_task: asyncio.Task | None = None
 
     def set_initial_timestamp(self) -> None:
         """Set the initial timestamp after a successful setup."""
         self._last_successful_update_time = asyncio.get_running_loop().time()
 
-    def _checksum(self, data: bytes) -> int:
-        """Calculate 2-byte big endian checksum."""
-        return sum(data) & 0xFFFF
-
     def _build_set_other_payload(self, new_values: dict) -> bytes:
         """Build the complete payload for the setOther command."""
-        current_status = self.status.copy()
-        current_status.update(new_values)
-
-        def to_unsigned_byte(x: int) -> int:
-            return x & 0xFF
-
-        data = bytearray(
-            [
-                int(current_status.get("locked", 0)),
-                int(current_status.get("powered_on", 1)),
-                int(current_status.get("run_mode", 0)),
-                int(current_status.get("bat_saver", 0)),
-                to_unsigned_byte(current_status.get("left_target", 0)),
-                to_unsigned_byte(current_status.get("temp_max", 20)),
-                to_unsigned_byte(current_status.get("temp_min", -20)),
-                to_unsigned_byte(current_status.get("left_ret_diff", 1)),
-                int(current_status.get("start_delay", 0)),
-                int(current_status.get("unit", 0)),
-                to_unsigned_byte(current_status.get("left_tc_hot", 0)),
-                to_unsigned_byte(current_status.get("left_tc_mid", 0)),
-                to_unsigned_byte(current_status.get("left_tc_cold", 0)),
-                to_unsigned_byte(current_status.get("left_tc_halt", 0)),
-            ]
-        )
-
-        if "right_current" in current_status:
-            right_zone_data = bytearray(
-                [
-                    to_unsigned_byte(current_status.get("right_target", 0)),
-                    0,
-                    0,
-                    to_unsigned_byte(current_status.get("right_ret_diff", 1)),
-                    to_unsigned_byte(current_status.get("right_tc_hot", 0)),
-                    to_unsigned_byte(current_status.get("right_tc_mid", 0)),
-                    to_unsigned_byte(current_status.get("right_tc_cold", 0)),
-                    to_unsigned_byte(current_status.get("right_tc_halt", 0)),
-                    0,
-                    0,
-                    0,
-                ]
+        if "right_current" not in self.status:
+            return _SET_OTHER.pack(
+                *_set_other_values({**_SET_OTHER_DEFAULTS, **self.status, **new_values})
             )
-            data.extend(right_zone_data)
-
-        return data
+        return _SET_OTHER_DUAL.pack(
+            *_set_other_dual_values(
+                {**_SET_OTHER_DUAL_DEFAULTS, **self.status, **new_values}
+            )
+        )
 
     async def async_set_values(self, new_values: dict) -> None:
         """Public method to set configuration values."""
@@ -95,150 +239,258 @@ class FridgeApi:
             _LOGGER.debug("Cannot set values, status is not available")
             return
 
-        payload = self._build_set_other_payload(new_values)
-        packet = self._build_packet(Request.SET, payload)
-        await self._send_raw(packet)
-
-    def _build_packet(self, cmd: int, data: bytes = b"") -> bytes:
-        """Build a BLE command packet based on known working examples and protocol quirks."""
-        if cmd == Request.BIND:
-            return b"\xfe\xfe\x03\x00\x01\xff"
-        if cmd == Request.QUERY:
-            return b"\xfe\xfe\x03\x01\x02\x00"
-
-        _LOGGER.debug("Using dynamic builder for cmd %s", cmd)
-
-        header = b"\xfe\xfe"
-        payload = bytearray([cmd])
-        payload.extend(data)
-
-        length = len(payload) + 2
-
-        packet = bytearray(header)
-        packet.append(length)
-        packet.extend(payload)
-
-        checksum = self._checksum(packet)
-        packet.extend(checksum.to_bytes(2, "big"))
+        # Only trust a status read after the last write and recently enough
+        # that the fridge's own panel can't have changed it since
+        if self._status_is_fresh():
+            new_values = {
+                key: value
+                for key, value in new_values.items()
+                if key in self._pending_values or self.status.get(key) != value
+            }
+            if not new_values:
+                _LOGGER.debug("Values already set, skipping write")
+                return
 
-        _LOGGER.debug("Dynamically built packet for cmd %s: %s", cmd, packet.hex())
-        return bytes(packet)
+        self._pending_values.update(new_values)
+        await self._queue_write()
 
     async def async_set_temperature(self, zone: str, temp: int) -> None:
         """Public method to set the target temperature for a specific zone."""
         cmd = Request.SET_LEFT if zone == "left" else Request.SET_RIGHT
-        payload = bytes([temp & 0xFF])
+        key = f"{zone}_target"
+        if (
+            self._status_is_fresh()
+            and cmd not in self._pending_temperatures
+            and self.status.get(key) == temp
+        ):
+            _LOGGER.debug("Target temperature already set, skipping write")
+            return
+        self._pending_temperatures[cmd] = (key, temp)
+        await self._queue_write()
+
+    async def _queue_write(self) -> None:
+        """Wait until the pending writes have been flushed to the fridge.
+
+        Every new write restarts the debounce timer, so only the latest value
+        per command is sent once the writes settle.
+        """
+        loop = asyncio.get_running_loop()
+        if self._flush_handle:
+            self._flush_handle.cancel()
+        if self._flush_future is None:
+            self._flush_future = loop.create_future()
+        future = self._flush_future
+        self._flush_handle = loop.call_later(_WRITE_DEBOUNCE_DELAY, self._start_flush)
+        await asyncio.shield(future)
+
+    def _start_flush(self) -> None:
+        """Start sending the pending writes once the debounce timer fires."""
+        self._flush_handle = None
+        future, self._flush_future = self._flush_future, None
+        self._flush_task = asyncio.get_running_loop().create_task(
+            self._flush_pending(future)
+        )
 
-        packet = self._build_packet(cmd, payload)
-        await self._send_raw(packet)
+    async def _flush_pending(self, future: asyncio.Future | None) -> None:
+        """Send all pending writes back-to-back."""
+        error: BaseException | None = None
+        try:
+            # Keeps a flush from interleaving with another flush or a status query
+            async with self._lock:
+                if not self._client.is_connected:
+                    # Hold the writes, the poll loop flushes them once
+                    # reconnected. Newer writes to the same setting replace
+                    # the held ones.
+                    _LOGGER.debug("Not connected, holding writes until reconnected")
+                    return
+                values, self._pending_values = self._pending_values, {}
+                # From here on the status no longer reflects the fridge: writes
+                # made during the sends must not be skipped against it, and the
+                # next update_status has to query again.
+                self._status_time = None
+                temperatures, self._pending_temperatures = (
+                    self._pending_temperatures,
+                    {},
+                )
+                # Written values are applied to the status right away, so a
+                # setOther that follows before the fridge reports back is built
+                # from them instead of reverting them. The next status report
+                # is always decoded, replacing them with what the fridge took.
+                self._last_status_payload = None
+                # setOther carries the zone targets too, so send it before the
+                # dedicated temperature commands to let those win.
+                if values:
+                    payload = self._build_set_other_payload(values)
+                    await self._send_raw(
+                        _build_packet(Request.SET, payload), confirm=True
+                    )
+                    self.status.update(values)
+                for cmd, (key, temp) in temperatures.items():
+                    await self._send_raw(_temperature_packet(cmd, temp), confirm=True)
+                    self.status[key] = temp
+        except asyncio.CancelledError:
+            error = BleakError("Write cancelled before it was sent")
+            raise
+        except Exception as e:
+            error = e
+            if future is None:
+                _LOGGER.debug("Failed to send held writes: %s", e)
+        finally:
+            # Callers wait on the future, it must be resolved however the
+            # flush ends
+            if future is not None and not future.done():
+                if error is None:
+                    future.set_result(None)
+                else:
+                    future.set_exception(error)
+
+    def _decode_status(self, payload: bytes) -> bool:
+        """Decode query response payload for single or dual zone fridges.
+
+        Returns False if the payload could not be decoded.
+        """
+        if len(payload) >= _STATUS_EXTENDED.size:
+            fmt, keys = _STATUS_EXTENDED, _STATUS_EXTENDED_KEYS
+        elif len(payload) >= _STATUS_DUAL.size:
+            fmt, keys = _STATUS_DUAL, _STATUS_DUAL_KEYS
+        else:
+            fmt, keys = _STATUS_BASE, _STATUS_BASE_KEYS
 
-    def _decode_status(self, payload: bytes):
-        """Decode query response payload for single or dual zone fridges."""
         try:
-            base_status = {
-                "locked": bool(payload[0]),
-                "powered_on": bool(payload[1]),
-                "run_mode": payload[2],
-                "bat_saver": payload[3],
-                "left_target": _to_signed_byte(payload[4]),
-                "temp_max": _to_signed_byte(payload[5]),
-                "temp_min": _to_signed_byte(payload[6]),
-                "left_ret_diff": _to_signed_byte(payload[7]),
-                "start_delay": payload[8],
-                "unit": payload[9],
-                "left_tc_hot": _to_signed_byte(payload[10]),
-                "left_tc_mid": _to_signed_byte(payload[11]),
-                "left_tc_cold": _to_signed_byte(payload[12]),
-                "left_tc_halt": _to_signed_byte(payload[13]),
-                "left_current": _to_signed_byte(payload[14]),
-                "bat_percent": payload[15],
-                "bat_vol_int": payload[16],
-                "bat_vol_dec": payload[17],
-            }
-            self.status.update(base_status)
-            if len(payload) >= 28:
-                dual_zone_status = {
-                    "right_target": _to_signed_byte(payload[18]),
-                    "unknown_19": payload[19],
-                    "unknown_20": payload[20],
-                    "right_ret_diff": _to_signed_byte(payload[21]),
-                    "right_tc_hot": _to_signed_byte(payload[22]),
-                    "right_tc_mid": _to_signed_byte(payload[23]),
-                    "right_tc_cold": _to_signed_byte(payload[24]),
-                    "right_tc_halt": _to_signed_byte(payload[25]),
-                    "right_current": _to_signed_byte(payload[26]),
-                    "running_status": payload[27],
-                }
-                self.status.update(dual_zone_status)
-
-            # Check for extra unknown fields at the end
-            if len(payload) >= 31:
-                extra_unknown_status = {
-                    "unknown_28": payload[28],
-                    "unknown_29": payload[29],
-                    "unknown_30": payload[30],
-                }
-                self.status.update(extra_unknown_status)
-
-            _LOGGER.debug("Decoded status: %s", self.status)
-        except IndexError as e:
+            values = fmt.unpack_from(payload)
+        except struct.error as e:
             _LOGGER.debug(
                 "Failed to decode status payload (length %s): %s", len(payload), e
             )
+            return False
+
+        # Updated in place: this runs synchronously on the event loop, so no
+        # entity can observe a partially updated status
+        self.status.update(zip(keys, values))
+        _LOGGER.debug("Decoded status: %s", self.status)
+        return True
 
     def _notification_handler(self, sender, data: bytearray):
         """Handle notifications, reassembling fragmented packets before parsing."""
-        self._notification_buffer.extend(data)
-
-        while self._notification_buffer:
-            start_index = self._notification_buffer.find(b"\xfe\xfe")
-            if start_index == -1:
-                _LOGGER.debug(
-                    "No packet header in buffer, clearing: %s",
-                    self._notification_buffer.hex(),
-                )
-                self._notification_buffer.clear()
+        # .hex() is evaluated eagerly, only pay for it when debug logging is on
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        buffer = self._notification_buffer
+
+        # Most notifications carry exactly one complete packet, handle those
+        # without copying them through the reassembly buffer.
+        if not buffer and len(data) >= _HEADER.size:
+            magic, packet_len_byte = _HEADER.unpack_from(data)
+            if (
+                magic == _PACKET_MAGIC
+                and packet_len_byte
+                and len(data) == _HEADER.size + packet_len_byte
+            ):
+                with memoryview(data) as packet:
+                    self._handle_packet(sender, packet)
                 return
 
-            if start_index > 0:
-                _LOGGER.debug(
-                    "Discarding preamble: %s",
-                    self._notification_buffer[:start_index].hex(),
-                )
-                self._notification_buffer = self._notification_buffer[start_index:]
+        buffer.extend(data)
+        # Read cursor into the buffer; consumed bytes are dropped once at the end
+        # instead of reslicing the remaining buffer after every packet.
+        pos = 0
 
-            if len(self._notification_buffer) < 3:
-                _LOGGER.debug("Buffer too short for length byte, waiting for more data")
-                return
+        try:
+            with memoryview(buffer) as view:
+                while pos < len(buffer):
+                    # Well-framed streams start with a header at the cursor, so
+                    # peek it directly and only scan when it is not there.
+                    if len(buffer) - pos >= _HEADER.size:
+                        magic, packet_len_byte = _HEADER.unpack_from(buffer, pos)
+                    else:
+                        magic = None
+
+                    if magic != _PACKET_MAGIC:
+                        start_index = buffer.find(_PACKET_MAGIC, pos)
+                        if start_index == -1:
+                            if debug:
+                                _LOGGER.debug(
+                                    "No packet header in buffer, clearing: %s",
+                                    view[pos:].hex(),
+                                )
+                            pos = len(buffer)
+                            break
+
+                        if start_index > pos:
+                            if debug:
+                                _LOGGER.debug(
+                                    "Discarding preamble: %s",
+                                    view[pos:start_index].hex(),
+                                )
+                            pos = start_index
+                            continue
+
+                    if len(buffer) - pos < _HEADER.size:
+                        _LOGGER.debug(
+                            "Buffer too short for length byte, waiting for more data"
+                        )
+                        break
 
-            packet_len_byte = self._notification_buffer[2]
-            expected_total_len = 3 + packet_len_byte
+                    if not packet_len_byte:
+                        # Every packet carries at least a command byte, this is
+                        # a stray magic sequence (e.g. inside a payload)
+                        _LOGGER.debug("Zero length packet, resyncing")
+                        pos += len(_PACKET_MAGIC)
+                        continue
 
-            if len(self._notification_buffer) < expected_total_len:
-                _LOGGER.debug(
-                    "Incomplete packet. Have %s, need %s. Waiting for more data",
-                    len(self._notification_buffer),
-                    expected_total_len,
-                )
-                return
+                    expected_total_len = _HEADER.size + packet_len_byte
 
-            current_packet = self._notification_buffer[:expected_total_len]
-            self._notification_buffer = self._notification_buffer[expected_total_len:]
+                    if len(buffer) - pos < expected_total_len:
+                        _LOGGER.debug(
+                            "Incomplete packet. Have %s, need %s. Waiting for more data",
+                            len(buffer) - pos,
+                            expected_total_len,
+                        )
+                        break
 
-            _LOGGER.debug("<-- RECEIVED from %s: %s", sender, current_packet.hex())
+                    with view[pos : pos + expected_total_len] as current_packet:
+                        pos += expected_total_len
+                        self._handle_packet(sender, current_packet)
+        finally:
+            # Consumed bytes are dropped even when handling a packet failed,
+            # so one bad packet can't wedge the stream. What remains is at most
+            # one incomplete packet (258 bytes), which bounds the buffer.
+            del buffer[:pos]
+
+    def _handle_packet(self, sender, packet: memoryview):
+        """Dispatch a single complete packet received from the fridge."""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("<-- RECEIVED from %s: %s", sender, packet.hex())
+
+        cmd = packet[3]
+        if (handler := self._packet_handlers.get(cmd)) is None:
+            _LOGGER.debug("Unhandled command in notification: %s", cmd)
+            return
+        # Released on the way out, even if the handler raises, so the
+        # reassembly buffer can still be compacted
+        with packet[4:] as payload:
+            handler(payload)
+
+    def _on_status(self, payload: memoryview) -> None:
+        """Handle a status response."""
+        # Idle fridges mostly report the same status, skip decoding and
+        # the entity update fan-out when nothing changed.
+        if payload != self._last_status_payload:
+            if not self._decode_status(payload):
+                # A malformed reply confirms nothing, don't mark the status fresh
+                _resolve_future(self._status_future, False)
+                return
+            self._last_status_payload = bytes(payload)
+            self._status_changed = True
+        self._status_time = time.monotonic()
+        _resolve_future(self._status_future, True)
 
-            cmd = current_packet[3]
-            payload = current_packet[4:]
+    def _on_bind(self, payload: memoryview) -> None:
+        """Handle a bind response."""
+        _resolve_future(self._bind_future, True)
 
-            if cmd in [Request.QUERY]:
-                self._decode_status(payload)
-                self._status_updated_event.set()
-            elif cmd == Request.BIND:
-                self._bind_event.set()
-            elif cmd in [Request.SET_LEFT, Request.SET_RIGHT, Request.SET]:
-                _LOGGER.debug("Ignoring echo for SET command")
-            else:
-                _LOGGER.debug("Unhandled command in notification: %s", cmd)
+    def _on_set_echo(self, payload: memoryview) -> None:
+        """Handle the echo the fridge sends for SET commands."""
+        _LOGGER.debug("Ignoring echo for SET command")
 
     async def connect(self, is_reconnect: bool = False) -> bool:
         """Connect to the fridge and try to bind, with a fallback."""
@@ -248,22 +500,18 @@ class FridgeApi:
                 await self._client.connect()
 
             _LOGGER.debug("Discovering services and characteristics")
-            write_char = None
-            for service in self._client.services:
-                for char in service.characteristics:
-                    if char.uuid.lower() == FRIDGE_RW_CHARACTERISTIC_UUID.lower():
-                        write_char = char
-                        break
-                if write_char:
-                    break
+            write_char = self._client.services.get_characteristic(
+                FRIDGE_RW_CHARACTERISTIC_UUID
+            )
 
             if not write_char:
                 _LOGGER.error(
                     "Write characteristic %s not found!", FRIDGE_RW_CHARACTERISTIC_UUID
                 )
-                await self.disconnect()
+                await self._close_connection()
                 return False
 
+            self._write_supports_response = "write" in write_char.properties
             if "write-without-response" in write_char.properties:
                 self._write_requires_response = False
                 _LOGGER.debug("Using 'write-without-response' for commands")
@@ -277,34 +525,61 @@ class FridgeApi:
                     "Write characteristic %s has no usable write properties",
                     write_char.uuid,
                 )
-                await self.disconnect()
+                await self._close_connection()
                 return False
 
-            await self._client.start_notify(
-                FRIDGE_NOTIFY_UUID, self._notification_handler
-            )
+            notify_char = self._client.services.get_characteristic(FRIDGE_NOTIFY_UUID)
+            if not notify_char:
+                _LOGGER.error("Notify characteristic %s not found!", FRIDGE_NOTIFY_UUID)
+                await self._close_connection()
+                return False
+
+            # Keep the resolved characteristics so writes and notifications
+            # skip the UUID lookup inside bleak.
+            self._write_char = write_char
+            self._notify_char = notify_char
+
+            if not self._notify_started:
+                await self._client.start_notify(
+                    self._notify_char, self._notification_handler
+                )
+                self._notify_started = True
 
         except BleakError as e:
             _LOGGER.error("Failed to establish base BLE connection: %s", e)
-            await self.disconnect()
+            await self._close_connection()
             return False
         if not is_reconnect:
             _LOGGER.debug("Base BLE connection successful. Attempting to bind")
+            loop = asyncio.get_running_loop()
+            bind_future = self._bind_future = loop.create_future()
+            if self._status_future is None or self._status_future.done():
+                self._status_future = loop.create_future()
+            status_future = self._status_future
+            timeout_handle = loop.call_later(
+                _BIND_TIMEOUT, _resolve_future, bind_future, False
+            )
             try:
-                self._bind_event.clear()
-                bind_packet = self._build_packet(Request.BIND, b"\x01")
-                await self._send_raw(bind_packet)
-
-                await asyncio.wait_for(self._bind_event.wait(), timeout=20)
-                _LOGGER.debug("Bind successful")
-            except TimeoutError:
-                _LOGGER.debug(
-                    "Bind command timed out. Proceeding without binding. This may work for some models"
-                )
+                # Query right behind the bind, so the status is usually in by
+                # the time the bind completes and setup needn't query again.
+                await self._send_raw(_BIND_PACKET, confirm=True)
+                await self._send_raw(_QUERY_PACKET)
+
+                if await bind_future:
+                    _LOGGER.debug("Bind successful")
+                else:
+                    _LOGGER.debug(
+                        "Bind command timed out. Proceeding without binding. This may work for some models"
+                    )
             except BleakError as e:
                 _LOGGER.debug(
                     "An error occurred during bind, proceeding without it: %s", e
                 )
+            finally:
+                timeout_handle.cancel()
+                # A query sent before pairing finished may never be answered,
+                # let the next update_status send its own.
+                _resolve_future(status_future, False)
         else:
             _LOGGER.debug("Skipping bind process for reconnect")
 
@@ -314,82 +589,171 @@ class FridgeApi:
         _LOGGER.debug("Connection is not active after connect attempt")
         return False
 
+    def _on_disconnected(self, client: BleakClient) -> None:
+        """Handle the BLE connection dropping."""
+        _LOGGER.debug("Disconnected from %s", self._address)
+        self._notify_started = False
+        self._write_char = None
+        self._notify_char = None
+
     async def disconnect(self):
-        """Disconnect from the fridge."""
+        """Stop polling and disconnect from the fridge, when unloading."""
         if self._poll_task:
             self._poll_task.cancel()
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._flush_future and not self._flush_future.done():
+            self._flush_future.set_exception(
+                BleakError("Disconnected before the write was sent")
+            )
+        self._flush_future = None
+        if self._flush_task and not self._flush_task.done():
+            # Don't let a running flush write to a client being torn down, the
+            # flush fails its callers when cancelled
+            self._flush_task.cancel()
+            await asyncio.wait((self._flush_task,))
+        self._flush_task = None
+        # Held writes are only dropped when unloading, a failed reconnect goes
+        # through _close_connection() and keeps them for the next attempt
+        self._pending_values.clear()
+        self._pending_temperatures.clear()
+        await self._close_connection()
+
+    async def _close_connection(self) -> None:
+        """Close the BLE connection, leaving polling and pending writes alone.
+
+        Used when a (re)connect attempt fails, the poll loop retries later.
+        """
         if self._client and self._client.is_connected:
             await self._client.disconnect()
-
-    async def _send_raw(self, packet: bytes):
-        """Send raw packet to fridge, adapting write method."""
-        if not self._client.is_connected:
+        self._notify_started = False
+        self._write_char = None
+        self._notify_char = None
+
+    async def _send_raw(self, packet: bytes, confirm: bool = False):
+        """Send raw packet to fridge, adapting write method.
+
+        With confirm, the packet goes out as a write request when the fridge
+        supports it, so a lost command raises instead of passing silently.
+        Queries don't need it, their answer confirms them.
+        """
+        if not self._client.is_connected or not self._write_char:
             _LOGGER.debug("Cannot send, not connected")
             return
-        _LOGGER.debug("--> SENDING: %s", packet.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("--> SENDING: %s", packet.hex())
         await self._client.write_gatt_char(
-            FRIDGE_RW_CHARACTERISTIC_UUID,
+            self._write_char,
             packet,
-            response=self._write_requires_response,
+            response=self._write_requires_response
+            or (confirm and self._write_supports_response),
+        )
+
+    def _status_is_fresh(self, max_age: float = _STATUS_MAX_AGE) -> bool:
+        """Return True if the status was read after the last write, within max_age."""
+        return (
+            self._status_time is not None
+            and time.monotonic() - self._status_time < max_age
         )
 
-    async def update_status(self) -> bool:
-        """Request status and wait for notification. Returns True on success, False on timeout."""
+    async def update_status(self, max_age: float = _STATUS_MAX_AGE) -> bool:
+        """Request status and wait for notification. Returns True on success, False on timeout.
+
+        A status received less than max_age seconds ago is reused without a query.
+        """
         if not self._client.is_connected:
             _LOGGER.debug("Cannot update status, not connected")
             return False
 
-        self._status_updated_event.clear()
-        await self._send_raw(self._build_packet(Request.QUERY, b"\x02"))
+        if self._status_is_fresh(max_age):
+            _LOGGER.debug("Status is still fresh, skipping query")
+            return True
+
+        loop = asyncio.get_running_loop()
+        # Concurrent callers share the pending response, only the first one
+        # sends a query
+        query = self._status_future is None or self._status_future.done()
+        if query:
+            self._status_future = loop.create_future()
+        future = self._status_future
+        timeout_handle = loop.call_later(5, _resolve_future, future, False)
         try:
-            await asyncio.wait_for(self._status_updated_event.wait(), timeout=5)
-        except TimeoutError:
-            _LOGGER.debug("Timeout waiting for status update")
-            return False
-        else:
+            if query:
+                # Don't interleave with a command flush, but only hold the lock
+                # for the write itself, not while waiting for the response.
+                async with self._lock:
+                    try:
+                        await self._send_raw(_QUERY_PACKET)
+                    except BaseException:
+                        # Also on cancellation, don't leave callers that joined
+                        # waiting for the timeout
+                        _resolve_future(future, False)
+                        raise
+            if not await asyncio.shield(future):
+                _LOGGER.debug("Timeout waiting for status update")
+                return False
             return True
+        finally:
+            timeout_handle.cancel()
 
     async def start_polling(self, update_callback):
         """Start polling for status updates in the background."""
         _LOGGER.debug("Starting background polling")
+        # Remember the task so disconnect() stops polling before tearing down
+        self._poll_task = asyncio.current_task()
+        loop = asyncio.get_running_loop()
         if self._last_successful_update_time == 0.0:
-            self._last_successful_update_time = asyncio.get_running_loop().time()
+            self._last_successful_update_time = loop.time()
+        # Availability last pushed to the entities
+        dispatched_available = None
+        # Consecutive polls without a status update, widens the retry interval
+        failures = 0
+        # Polls are scheduled against a deadline, so the time spent talking to
+        # the fridge doesn't stretch the interval. A schedule that fell behind
+        # restarts from now instead of firing the missed polls back-to-back.
+        deadline = loop.time()
         while True:
             try:
-                if not self._client.is_connected:
+                updated = False
+                connected = self._client.is_connected
+                if not connected:
                     _LOGGER.debug("Device disconnected, attempting to reconnect")
-                    if await self.connect(is_reconnect=True):
+                    # connect() only reports success with an active connection
+                    connected = await self.connect(is_reconnect=True)
+                    if connected:
                         _LOGGER.debug("Successfully reconnected to device")
                         self.is_available = True
-                        self._last_successful_update_time = (
-                            asyncio.get_running_loop().time()
-                        )
+                        self._last_successful_update_time = loop.time()
+                        if self._pending_values or self._pending_temperatures:
+                            await self._flush_pending(None)
                     else:
                         _LOGGER.debug("Reconnect failed. Will retry later")
-                if self._client.is_connected:
-                    if await self.update_status():
-                        self._last_successful_update_time = (
-                            asyncio.get_running_loop().time()
-                        )
+                if connected:
+                    if await self.update_status(max_age=_POLL_STATUS_MAX_AGE):
+                        updated = True
+                        self._last_successful_update_time = loop.time()
                         if not self.is_available:
                             _LOGGER.debug("Device communication restored")
                             self.is_available = True
-                time_since_success = (
-                    asyncio.get_running_loop().time()
-                    - self._last_successful_update_time
-                )
+                time_since_success = loop.time() - self._last_successful_update_time
                 if time_since_success > 300:  # 5 minutes
                     if self.is_available:
                         _LOGGER.debug(
                             "Device has been unreachable for over 5 minutes. Marking as unavailable"
                         )
+                        # Keep the last known status, entities report
+                        # unavailable based on is_available.
                         self.is_available = False
-                        self.status.clear()
-                update_callback()
+                if self._status_changed or self.is_available != dispatched_available:
+                    self._status_changed = False
+                    dispatched_available = self.is_available
+                    update_callback()
 
                 # --- Sleep ---
-                sleep_duration = 30 if self._client.is_connected else 60
-                await asyncio.sleep(sleep_duration)
+                failures = 0 if updated else failures + 1
+                deadline = max(deadline + _poll_delay(failures), loop.time())
+                await asyncio.sleep(deadline - loop.time())
 
             except asyncio.CancelledError:
                 _LOGGER.debug("Polling task cancelled")
@@ -398,4 +762,6 @@ class FridgeApi:
             except BleakError as e:
                 _LOGGER.debug("An unexpected BLE error occurred during polling: %s", e)
                 self.is_available = False
-                await asyncio.sleep(60)
+                failures += 1
+                deadline = max(deadline + _poll_delay(failures), loop.time())
+                await asyncio.sleep(deadline - loop.time())
@@ -1,6 +1,5 @@
 """Climate platform for the Alpicool BLE integration."""
 
-import asyncio
 import logging
 from typing import Any
 
@@ -8,7 +7,8 @@ from homeassistant.components.climate import ClimateEntity
 from homeassistant.components.climate.const import ClimateEntityFeature, HVACMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
@@ -25,6 +25,22 @@ from .entity import AlpicoolEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Preset modes indexed by the run_mode they select
+_PRESET_MODES_DUAL = [PRESET_FRIDGE, PRESET_FREEZER]
+_PRESET_MODES_SINGLE = [PRESET_MAX, PRESET_ECO]
+# Presets selecting run_mode 1, the others select run_mode 0
+_RUN_MODE_1_PRESETS = frozenset({PRESET_ECO, PRESET_FREEZER})
+
+# Command values, async_set_values only reads them
+_POWER_ON = {"powered_on": True}
+_POWER_OFF = {"powered_on": False}
+_RUN_MODE_0 = {"run_mode": 0}
+_RUN_MODE_1 = {"run_mode": 1}
+
+# Settle time before reading back the status after a command, commands sent
+# in quick succession share a single refresh
+_REFRESH_COOLDOWN = 0.5
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -61,87 +77,101 @@ class AlpicoolClimateZone(AlpicoolEntity, ClimateEntity):
         self._zone = zone
         # Read the configuration option selected by the user
         self._has_fridge_freezer_mode = entry.data.get(CONF_DUAL_ZONE_MODES, False)
+        # The zone layout doesn't change at runtime, entities are created from
+        # the status read during setup
+        self._is_dual_zone = "right_current" in api.status
+        self._fridge_freezer_presets = (
+            self._is_dual_zone and self._has_fridge_freezer_mode
+        )
+        self._attr_preset_modes = (
+            _PRESET_MODES_DUAL if self._fridge_freezer_presets else _PRESET_MODES_SINGLE
+        )
+        self._current_key = f"{zone}_current"
+        self._target_key = f"{zone}_target"
+        # Values behind the last written state, see _async_handle_update
+        self._last_written: tuple | None = None
 
         self._attr_unique_id = f"{self._address}_{self._zone}"
         self._attr_name = f"{self._zone.capitalize()}"
+        self._refresh_debouncer: Debouncer | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Set up the state and the status refresh after commands."""
+        await super().async_added_to_hass()
+        self._async_update_attrs()
+        self._refresh_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self._async_refresh_status,
+            # The read-back is not part of the service call, don't make
+            # startup or shutdown wait for it
+            background=True,
+        )
+        self.async_on_remove(self._refresh_debouncer.async_shutdown)
+
+    async def _async_refresh_status(self) -> None:
+        """Read back the status after a command and push it to the entities."""
+        if await self.api.update_status():
+            async_dispatcher_send(self.hass, self._update_signal)
 
-    @property
-    def _is_dual_zone(self) -> bool:
-        """Helper to check if this is a dual-zone model."""
-        return "right_current" in self.api.status
-
-    @property
-    def preset_modes(self) -> list[str] | None:
-        """Return a list of available preset modes based on user configuration."""
-        if self._is_dual_zone and self._has_fridge_freezer_mode:
-            return [PRESET_FRIDGE, PRESET_FREEZER]
-        return [PRESET_MAX, PRESET_ECO]
-
-    @property
-    def available(self) -> bool:
-        """Return True if the device and this specific zone are available."""
-        if not super().available:
-            return False
-
+    @callback
+    def _async_update_available(self) -> None:
+        """Update the availability of the device and this specific zone."""
+        super()._async_update_available()
         # For configured dual-zone models, the right zone is only available in Freezer mode
         if (
-            self._is_dual_zone
-            and self._has_fridge_freezer_mode
+            self._attr_available
+            and self._fridge_freezer_presets
             and self._zone == "right"
         ):
             # run_mode 0 is Fridge, 1 is Freezer
-            if self.api.status.get("run_mode") == 0:
-                return False
-
-        return True
-
-    @property
-    def hvac_mode(self) -> HVACMode | None:
-        """Return hvac operation."""
-        return HVACMode.COOL if self.api.status.get("powered_on") else HVACMode.OFF
-
-    @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature for this zone."""
-        return self.api.status.get(f"{self._zone}_current")
-
-    @property
-    def target_temperature(self) -> float | None:
-        """Return the target temperature for this zone."""
-        return self.api.status.get(f"{self._zone}_target")
-
-    @property
-    def preset_mode(self) -> str | None:
-        """Return the current preset mode, adapted for user configuration."""
-        run_mode = self.api.status.get("run_mode")
-        if self._is_dual_zone and self._has_fridge_freezer_mode:
-            return PRESET_FREEZER if run_mode == 1 else PRESET_FRIDGE
-        return PRESET_ECO if run_mode == 1 else PRESET_MAX
+            self._attr_available = self.api.status.get("run_mode") != 0
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the state attributes from the fridge status."""
+        status = self.api.status
+        self._attr_hvac_mode = (
+            HVACMode.COOL if status.get("powered_on") else HVACMode.OFF
+        )
+        self._attr_preset_mode = self._attr_preset_modes[status.get("run_mode") == 1]
+        self._attr_current_temperature = status.get(self._current_key)
+        self._attr_target_temperature = status.get(self._target_key)
+
+    @callback
+    def _async_handle_update(self) -> None:
+        """Write the state only if something this zone shows has changed."""
+        self._async_update_available()
+        self._async_update_attrs()
+        written = (
+            self._attr_available,
+            self._attr_hvac_mode,
+            self._attr_preset_mode,
+            self._attr_current_temperature,
+            self._attr_target_temperature,
+        )
+        if written == self._last_written:
+            return
+        self._last_written = written
+        self.async_write_ha_state()
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
         is_on = hvac_mode == HVACMode.COOL
-        await self.api.async_set_values({"powered_on": is_on})
-
-        await asyncio.sleep(0.5)
-        if await self.api.update_status():
-            async_dispatcher_send(self.hass, f"{DOMAIN}_{self._address}_update")
+        await self.api.async_set_values(_POWER_ON if is_on else _POWER_OFF)
+        self._refresh_debouncer.async_schedule_call()
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature for this zone."""
         if ATTR_TEMPERATURE in kwargs:
             temp = int(kwargs[ATTR_TEMPERATURE])
             await self.api.async_set_temperature(self._zone, temp)
-
-            await asyncio.sleep(0.5)
-            if await self.api.update_status():
-                async_dispatcher_send(self.hass, f"{DOMAIN}_{self._address}_update")
+            self._refresh_debouncer.async_schedule_call()
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
-        is_mode_1 = preset_mode in [PRESET_ECO, PRESET_FREEZER]
-        run_mode_value = 1 if is_mode_1 else 0
-        await self.api.async_set_values({"run_mode": run_mode_value})
-        await asyncio.sleep(0.5)
-        if await self.api.update_status():
-            async_dispatcher_send(self.hass, f"{DOMAIN}_{self._address}_update")
+        is_mode_1 = preset_mode in _RUN_MODE_1_PRESETS
+        await self.api.async_set_values(_RUN_MODE_1 if is_mode_1 else _RUN_MODE_0)
+        self._refresh_debouncer.async_schedule_call()
@@ -1,6 +1,7 @@
 """Models for the Alpicool BLE integration."""
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.device_registry import DeviceInfo
@@ -19,21 +20,31 @@ class AlpicoolEntity(Entity):
         """Initialize the entity."""
         self.api = api
         self._address = entry.data["address"]
+        self._update_signal = f"{DOMAIN}_{self._address}_update"
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._address)},
             name=entry.data["name"],
             manufacturer="Alpicool",
         )
 
-    @property
-    def available(self) -> bool:
-        """Return True if the device is available."""
-        return self.api.is_available
+    @callback
+    def _async_update_available(self) -> None:
+        """Update the availability from the fridge state."""
+        self._attr_available = self.api.is_available
+
+    @callback
+    def _async_handle_update(self) -> None:
+        """Handle a status or availability update from the fridge."""
+        self._async_update_available()
+        self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         """Connect to events."""
+        # Availability only changes along with an update signal, so it is
+        # kept in _attr_available instead of being evaluated on every read
+        self._async_update_available()
         self.async_on_remove(
             async_dispatcher_connect(
-                self.hass, f"{DOMAIN}_{self._address}_update", self.async_write_ha_state
+                self.hass, self._update_signal, self._async_handle_update
             )
         )